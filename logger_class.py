@@ -1,13 +1,109 @@
-"""Custom login module. Contain only Logger Class."""
+"""Custom login module.
+
+Contain Logger Class, its module-level alias 'log', CachedFormatter
+and FastRotatingFileHandler classes.
+"""
 
 from pathlib import Path
+from typing import Any, Optional
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 
 FILENAME: str = "logs/app.log"
 LEVEL: str | int = 10  # 10 - DEBUG
 CONSOLE_LEVEL: str | int = 10  # 10 - DEBUG
 FILE_LEVEL: str | int = 20  # 20 - INFO
+LOG_FORMAT: str = "%(asctime)s.%(msecs)03dZ - %(levelname)s: %(message)s"
+DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%S"  # ISO8601
+LOGGER_NAME: str = "calsync"
+BUFFER_CAPACITY: int = 1024  # records kept in memory before they are written to file
+FLUSH_INTERVAL: float = 30.0  # seconds between periodic writes of buffered records
+
+
+class CachedFormatter(logging.Formatter):
+    """Formatter which formats the timestamp only once per second.
+
+    Records created in the same second share the same 'asctime', so the result of
+    time.strftime is cached and reused. Milliseconds are added per record.  
+    The line layout is LOG_FORMAT, built directly in formatMessage instead of
+    the generic %-style substitution of the record dictionary.
+    """
+
+    def __init__(self, datefmt: str = DATE_FORMAT) -> None:
+        # LOG_FORMAT is still passed, so that Formatter.usesTime() sets record.asctime.
+        super().__init__(LOG_FORMAT, datefmt=datefmt, style="%")
+        # (whole second, formatted time) - kept in one tuple so handlers in different
+        # threads never see second and string from different records.
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return cached 'asctime' if the record was created in the same second."""
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached_time
+        if sec == cached_sec:
+            return cached_str
+        formatted = time.strftime(datefmt, self.converter(sec))
+        self._cached_time = (sec, formatted)
+        return formatted
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Return record formatted as LOG_FORMAT."""
+        return (
+            f"{record.asctime}.{int(record.msecs):03d}Z - "
+            f"{record.levelname}: {record.message}"
+        )
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler which skips file checks when the file is far from its size limit.
+
+    RotatingFileHandler.shouldRollover() calls os.path.exists and os.path.isfile for
+    every record. This handler first compares stream position with maxBytes and makes
+    the full check only when the record could exceed the limit.
+    """
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Return True only if writing the record would exceed maxBytes."""
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        # +1 for the terminator added by StreamHandler.emit().
+        if self.stream.tell() + len(self.format(record)) + 1 < self.maxBytes:
+            return False
+        return bool(super().shouldRollover(record))
+
+
+def start_periodic_flush(handler: logging.Handler, interval: float) -> threading.Event:
+    """Start daemon thread which flushes handler every 'interval' seconds.
+
+    Args:
+        handler: Handler to flush, e.g. MemoryHandler
+        interval: Seconds between flushes
+
+    Returns:
+        Event which stops the thread when set.
+    """
+
+    stop_event = threading.Event()
+
+    def flush_loop() -> None:
+        while not stop_event.wait(interval):
+            handler.flush()
+
+    threading.Thread(target=flush_loop, name="log-flush", daemon=True).start()
+    return stop_event
 
 
 class Logger:
@@ -15,9 +111,14 @@ class Logger:
 
     Class atributes:
         - FILENAME (str): path to where logs are  
+        - LOGGER_NAME (str): Name of the logger used by the application  
+        - LOG_FORMAT (str): Layout of the log line  
+        - DATE_FORMAT (str): Timestamp format (ISO8601)  
         - LEVEL (str | int): Level on which logs will be shown  
         - CONSOLE_LEVEL (str | int): Level on which logs will be shown in console  
         - FILE_LEVEL (str | int): Level on which logs will be appended to file  
+        - BUFFER_CAPACITY (int): Number of records buffered before writing them to file  
+        - FLUSH_INTERVAL (float): Seconds after which buffered records are written anyway  
 
     Logging Levels:
         1. DEBUG (10): Detailed information for programmer.  
@@ -28,90 +129,120 @@ class Logger:
 
     Usage:
         Import Logger class from logger_class  
+        Call Logger.configure() once when the program starts.  
         Call class Looger() and use provided method.  
-        In methods use only args or only kwargs.  
+        Pass message as a %-style template and its values as args - logging module
+        formats the message only if the record is going to be emitted.  
     
+    Records are put in a queue and written to console and file by a QueueListener thread.  
+    Methods are classmethods, so there is no need to create an instance on every call.  
+    Module-level alias 'log' can be imported and used instead of 'Logger()'.  
+
     Example:
-        from logger_class import Logger  
-        >>> Logger().debug(kwargs=dict)  
+        from logger_class import Logger, log  
+        >>> Logger.configure()  
+        >>> log.info("Info message")  
+        >>> Logger().debug("Response: %s", response_dict)  
         >>> Logger().info("Info message")  
-        >>> Logger().warning(__name__, "Warning message")  
+        >>> Logger().info("Event ID: %s deleted", event_id)  
+        >>> Logger().warning("Warning message")  
         >>> Logger().error("Error message")  
+        >>> Logger().error("Request failed: %s", error, exc_info=error)  
         >>> Logger().critical("Critical message")  
     """
 
     folder_path = Path(__file__).parent.resolve()
     log_file_path = folder_path / FILENAME
-    if not log_file_path.exists():
-        raise FileNotFoundError(f"Configuration file not found at {log_file_path}")
-
-    logger = logging.getLogger()
-    logger.setLevel(LEVEL)
-
-    # configuring log format with timestamp in ISO8601
-    formatter = logging.Formatter(
-        "%(asctime)s.%(msecs)03dZ - %(levelname)s: %(message)s",
-        style="%",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-    )
-
-    # create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(CONSOLE_LEVEL)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # create a rotating file handler with a max size of 10MB and a backup count of 5
-    file_handler = RotatingFileHandler(
-        log_file_path, maxBytes=1024 * 1024 * 10, backupCount=5, encoding="utf-8"
-    )
-    file_handler.setLevel(FILE_LEVEL)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Named logger - third-party libraries log to their own loggers and don't use our handlers.
+    logger = logging.getLogger(LOGGER_NAME)
+    listener: Optional[QueueListener] = None
 
     @classmethod
-    def debug(cls, *text: str, **kwargs: dict[str, str]) -> None:
+    def configure(cls) -> None:
+        """Attach console and file handlers to the logger.
+
+        Should be called once when the program starts. Next calls do nothing,
+        so handlers are never attached twice.
+        """
+
+        if cls.logger.handlers:
+            return
+        if not cls.log_file_path.exists():
+            raise FileNotFoundError(f"Configuration file not found at {cls.log_file_path}")
+
+        cls.logger.setLevel(LEVEL)
+        cls.logger.propagate = False
+        # configuring log format with timestamp in ISO8601
+        formatter = CachedFormatter(DATE_FORMAT)
+
+        # create console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(CONSOLE_LEVEL)
+        console_handler.setFormatter(formatter)
+
+        # create a rotating file handler with a max size of 10MB and a backup count of 5
+        file_handler = FastRotatingFileHandler(
+            cls.log_file_path, maxBytes=1024 * 1024 * 10, backupCount=5, encoding="utf-8"
+        )
+        file_handler.setLevel(FILE_LEVEL)
+        file_handler.setFormatter(formatter)
+
+        # Buffer file records and write them in batches. ERROR and CRITICAL are written at once.
+        # Level is set here, because MemoryHandler.flush() doesn't check target handler level.
+        memory_handler = MemoryHandler(
+            BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        memory_handler.setLevel(FILE_LEVEL)
+        flush_stop_event = start_periodic_flush(memory_handler, FLUSH_INTERVAL)
+
+        # Logger only puts records in the queue. Writing to console and file (and rotation)
+        # is done by the listener in its own thread, so it doesn't block Flask requests.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        cls.logger.addHandler(QueueHandler(log_queue))
+        cls.listener = QueueListener(
+            log_queue, console_handler, memory_handler, respect_handler_level=True
+        )
+        cls.listener.start()
+        # Write all queued records before the program exits.
+        # Buffered records are written when logging.shutdown() closes memory_handler.
+        atexit.register(flush_stop_event.set)
+        atexit.register(cls.listener.stop)
+
+    @classmethod
+    def debug(cls, msg: object = "Debug level log", *args: object) -> None:
         """Log debug method"""
-        if kwargs:
-            cls.logger.debug(kwargs.get("kwargs", kwargs))
-        elif text:
-            log_text = " ".join(text).strip()
-            cls.logger.debug(log_text)
-        else:
-            cls.logger.debug("Debug level log")
+        if not cls.logger.isEnabledFor(logging.DEBUG):
+            return
+        cls.logger.debug(msg, *args)
 
     @classmethod
-    def info(cls, *text: str, **kwargs: dict[str, str]) -> None:
+    def info(cls, msg: object, *args: object) -> None:
         """Log info method"""
-        if kwargs:
-            cls.logger.info(kwargs.get("kwargs", kwargs))
-        else:
-            log_text = " ".join(text).strip()
-            cls.logger.info(log_text)
+        cls.logger.info(msg, *args)
 
     @classmethod
-    def warning(cls, *text: str, **kwargs: dict[str, str]) -> None:
+    def warning(cls, msg: object, *args: object) -> None:
         """Log warning method"""
-        if kwargs:
-            cls.logger.warning(kwargs.get("kwargs", kwargs))
-        else:
-            log_text = " ".join(text).strip()
-            cls.logger.warning(log_text)
+        cls.logger.warning(msg, *args)
 
     @classmethod
-    def error(cls, *text: str, **kwargs: dict[str, str]) -> None:
-        """Log error method"""
-        if kwargs:
-            cls.logger.error(kwargs.get("kwargs", kwargs))
-        else:
-            log_text = " ".join(text).strip()
-            cls.logger.error(log_text, exc_info=True)
+    def error(cls, msg: object, *args: object, exc_info: Any = True) -> None:
+        """Log error method
+
+        By default traceback of the exception being handled is added. Outside of
+        'except' block pass the exception (or False) as 'exc_info'.
+        """
+        cls.logger.error(msg, *args, exc_info=exc_info)
 
     @classmethod
-    def critical(cls, *text: str, **kwargs: dict[str, str]) -> None:
+    def critical(cls, msg: object, *args: object) -> None:
         """Log critical method"""
-        if kwargs:
-            cls.logger.critical(kwargs.get("kwargs", kwargs))
-        else:
-            log_text = " ".join(text).strip()
-            cls.logger.critical(log_text)
+        cls.logger.critical(msg, *args)
+
+
+# Methods are classmethods - reuse the class itself instead of creating instance per log call.
+log = Logger
@@ -46,28 +46,44 @@ Required pip modules:
     - google-api-python-client  (pip install google-api-python-client)
     - google-auth-httplib2      (pip install google-auth-httplib2)
     - google-auth-oauthlib      (pip install google-auth-oauthlib)
-    - validator-collection      (pip install validator-collection)
 
 The module contains the following functions:
+    - sync_events(services, time_now, debug_on) - 
+        Copies events changed in the main calendar to the target calendar.  
+    - build_services() - 
+        Builds Google Calendar API services.  
+    - get_services() - 
+        Takes services from the pool. Builds them only if the pool is empty.  
+    - release_services(services) - 
+        Puts services back to the pool.  
+    - get_events_page(service, calendar_id, updated_min, page_token) - 
+        Retrieves one page of events changed since 'updated_min'.  
     - time_now_minus_seconds_iso(time_now, seconds) - 
         Checks actual time and subtract from it 10 seconds.  
     - check_if_event_type_is_default(event) - 
         Checks if the event type is 'default'.  
+    - classify_event(event, config) - 
+        Checks event type, calendars in attendees and response status in one pass.  
     - check_what_to_do_with_event(target_event, status, response_status) - 
         Check conditionals and return str with info what to do with event.  
 
 Additional info:
 I'm using MyPy, if library does not have type hints, then I use # type: ignore[...]"""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timezone, datetime, timedelta
+import queue
+import shutil
 from typing import Optional
+import logging
 from flask import Flask
-from googleapiclient.discovery import build  # type: ignore[import-untyped]
+from google.auth.exceptions import GoogleAuthError
+from googleapiclient.discovery import build, Resource  # type: ignore[import-untyped]
 from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
 from project_notification_channel_class import NotificationChannel
-from project_config_class import Config
-from project_event_data import EventData
-from logger_class import Logger
+from project_config_class import Config, ConfigLike
+from project_event_data import EventData, reset_batch_queue, reset_retry_budget
+from logger_class import log
 
 app = Flask(__name__)
 
@@ -78,6 +94,17 @@ last_update_timestamp = datetime(2025, 4, 1, 8, 0, tzinfo=SERVER_TIMEZONE)
 
 CREDENTIALS = None
 TARGET_CREDENTIALS = None
+# Whole event bodies are copied to the target calendar, so 'items' can't be narrowed down.
+EVENTS_LIST_FIELDS = "nextPageToken,items"
+# Downloads next page of events while the current one is being processed.
+# Page is downloaded with the service of the webhook which requested it and the webhook
+# waits for it before requesting the next one, so a service is never used by two threads.
+PAGE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="events-page")
+
+# Pool of built Google Calendar API services - (service, target_service) pairs.
+# Services use httplib2, which is not thread-safe, so each webhook takes its own pair
+# and puts it back when it's done. Building a pair parses the discovery document.
+SERVICE_POOL: queue.SimpleQueue = queue.SimpleQueue()
 
 
 @app.route("/notifications", methods=["POST"])  # type: ignore
@@ -90,6 +117,8 @@ def main() -> str:
 
     global last_update_timestamp
 
+    # Checked once per webhook - with DEBUG disabled the main loop skips debug logs entirely.
+    debug_on = log.logger.isEnabledFor(logging.DEBUG)
     time_now = datetime.now(timezone.utc)
     resource_state = NotificationChannel.validate_post_request(
         time_now, last_update_timestamp
@@ -100,112 +129,234 @@ def main() -> str:
     # If resource_state == "exists", then update LAST_UPDATE_TIMESTAMP and last modified events
     last_update_timestamp = time_now
     try:
-        # Building the service to retrieve events from main calendar
-        service = build(
-            "calendar", "v3", credentials=CREDENTIALS, cache_discovery=False
-        )
-        # Building the service to create, update, or delete events in target calendar
-        target_service = build(
-            "calendar", "v3", credentials=TARGET_CREDENTIALS, cache_discovery=False
-        )
-    except HttpError as error:
-        Logger().error(f"An error occurred during building the service: {error}")
+        services = get_services()
+    except (HttpError, GoogleAuthError) as error:
+        log.error("An error occurred during building the service: %s", error)
         return "500"  # Internal Server Error
+    release = True
+    try:
+        return sync_events(services, time_now, debug_on)
+    except HttpError as e:
+        # Services are not put back to the pool - next webhook builds new ones.
+        release = False
+        log.error("An error occurred while retrieving events: %s", e)
+        return "500"
+    finally:
+        if release:
+            release_services(services)
+
+
+def sync_events(
+    services: tuple[Resource, Resource], time_now: datetime, debug_on: bool
+) -> str:
+    """Copies events changed in the main calendar to the target calendar.
 
-    page_token = ""
+    Args:
+        services: Service of the main calendar and service of the target calendar.
+        time_now: The time when the webhook was received.
+        debug_on: If True, whole events are logged.
+
+    Returns:
+        HTTP status code
+
+    Raises:
+        HttpError: If events can't be retrieved from the main calendar.
+    """
+
+    service, target_service = services
+    # Events resource of the target service is created once and reused by EventData.
+    EventData.bind(target_service)
+    # All retries in this webhook together wait at most RETRY_TIME_BUDGET seconds.
+    reset_retry_budget()
+    # Operations of this webhook are queued and sent only by this webhook.
+    reset_batch_queue()
+
+    # Fields used for every event are read from config once, not for every page and event.
+    snapshot = config.snapshot()
+    calendar_id = snapshot.calendar_id
+    target_calendar_id = snapshot.target_calendar_id
+
+    # Retrieve the list of events from the master calendar
+    # that has been changed in last 10 seconds. The same time is used for every page.
+    updated_min = time_now_minus_seconds_iso(time_now, seconds=10)
+    page_future = PAGE_EXECUTOR.submit(
+        get_events_page, service, calendar_id, updated_min, ""
+    )
 
     while True:
-        # Retrieve the list of events from the master calendar
-        # that has been changed in last 10 seconds
         try:
-            events_result = (
-                service.events()  # type: ignore
-                .list(
-                    calendarId=config.calendar_id,
-                    updatedMin=time_now_minus_seconds_iso(time_now, seconds=10),
-                    singleEvents=False,
-                    maxResults=250,
-                    pageToken=page_token,
-                )
-                .execute()
-            )
+            events_result = page_future.result()
+        except HttpError:
+            # Handled by main(), which drops these services.
+            raise
         except Exception as e:
-            Logger().error(f"An error occurred while retrieving events: {e}")
+            log.error("An error occurred while retrieving events: %s", e)
             return "500"
+        # Check if there is more events using 'nextPageToken' and start downloading
+        # next page while events from this page are being processed.
+        page_token = events_result.get("nextPageToken", "")
+        if page_token:
+            page_future = PAGE_EXECUTOR.submit(
+                get_events_page, service, calendar_id, updated_min, page_token
+            )
         events = events_result.get("items", [])
         if events:
+            # Events which have to be created, updated or deleted in target calendar.
+            # (event, event_id, event_summary, status, response_status)
+            events_to_sync: list[tuple[dict, str, str, str, Optional[str]]] = []
             for event in events:
                 # For debugging print whole event.
-                Logger().debug(f"Checking event: {event}")
-                event_data = EventData()
+                if debug_on:
+                    log.logger.debug("Checking event: %r", event)
+                # Fields used several times in this loop are read from event only once.
+                event_id = event.get("id", "")
+                event_summary = event.get("summary", "")
+                # Event type, attendees and response status are checked in one pass.
+                is_default, both_calendars, response_status = classify_event(
+                    event, snapshot
+                )
 
                 # Check if event type is default.
-                if not check_if_event_type_is_default(event):  # type: ignore[arg-type]
-                    Logger().info(
-                        f"Event ID: {event.get('id')}, summary: {event.get('summary')} "
-                        f"Event type is not default: {event.get('eventType')}. Skip."
+                if not is_default:
+                    log.info(
+                        "Event ID: %s, summary: %s Event type is not default: %s. Skip.",
+                        event_id,
+                        event_summary,
+                        event.get("eventType"),
                     )
                     continue
                 # Check if CALENDAR_ID and TARGET_CALENDAR_ID are attendees in event.
-                if event_data.check_calendars_in_attendees(event, config) == "Both":  # type: ignore
-                    Logger().info(
-                        f"Event ID: {event.get('id')}, summary: {event.get('summary')} "
-                        "Both calendars are in the event. Skip."
+                if both_calendars:
+                    log.info(
+                        "Event ID: %s, summary: %s Both calendars are in the event. Skip.",
+                        event_id,
+                        event_summary,
                     )
                     continue
-
-                event_id = event.get("id", "")
-                status = event.get("status", "")
-                target_event = event_data.check_if_id_exists_in_target_calendar(
-                    event_id, target_service, config
-                )
-                response_status = event_data.get_attendee_response_status(
-                    event, config.calendar_id  # type: ignore[arg-type]
+                events_to_sync.append(
+                    (event, event_id, event_summary, event.get("status", ""), response_status)
                 )
+
+            # Check all events of the page in target calendar with batch requests.
+            target_events = EventData.get_events_from_target_calendar(
+                [event_id for _, event_id, _, _, _ in events_to_sync], target_service, snapshot
+            )
+            for event, event_id, event_summary, status, response_status in events_to_sync:
+                event_data = EventData()
+                target_event = target_events.get(event_id)
                 match check_what_to_do_with_event(target_event, status, response_status):
                     # If event doesn't exists in Target Calendar and it's not been cancelled or
                     # declined then create new one in Target Calendar.
                     case "create":
-                        Logger().info(
-                            f"Event ID: {event['id']}, summary: {event['summary']}. "
-                            "Creating new event."
-                        )
-                        event_data.get_event_details(event, config)  # type: ignore[arg-type]
-                        event_data.pop_unnecessary_keys()
-                        event_data.create_new_event(
-                            config.target_calendar_id, target_service
+                        log.info(
+                            "Event ID: %s, summary: %s. Creating new event.",
+                            event_id,
+                            event_summary,
                         )
+                        event_data.get_event_details(event, snapshot)
+                        event_data.create_new_event(target_calendar_id, target_service)
                         continue
 
                     # If event does exists in Target Calendar and it is cancelled or declined
                     # then delete event in Target Calendar.
                     case "delete":
-                        Logger().info(
-                            f"Event ID: {event['id']}, summary: {event['summary']}. "
-                            "Deleting event."
-                        )
-                        event_data.delete_event(
-                            config.target_calendar_id, event_id, target_service
+                        log.info(
+                            "Event ID: %s, summary: %s. Deleting event.",
+                            event_id,
+                            event_summary,
                         )
+                        event_data.delete_event(target_calendar_id, event_id, target_service)
                         continue
 
                     # If event does exists in Target Calendar and it's not been cancelled or
                     # declined then update event in Target Calendar.
                     case "update":
-                        Logger().info(
-                            f"Event ID: {event['id']}, summary: {event['summary']}. "
-                            "Updating event."
+                        log.info(
+                            "Event ID: %s, summary: %s. Updating event.",
+                            event_id,
+                            event_summary,
                         )
-                        event_data.get_event_details(event, config)  # type: ignore[arg-type]
-                        event_data.pop_unnecessary_keys()
-                        event_data.update_event(target_service, event_id, config)
-        # Check if there is more events using 'nextPageToken
-        page_token = events_result.get("nextPageToken", "")
+                        event_data.get_event_details(event, snapshot)
+                        event_data.update_event(target_service, event_id, snapshot)
+            # Send queued create, update and delete operations in batch requests.
+            EventData.flush(target_service)
         if not page_token:
             break
     return "200"  # OK
 
 
+def build_services() -> tuple[Resource, Resource]:
+    """Builds Google Calendar API services.
+
+    Returns:
+        Service to retrieve events from main calendar and service to create, update,
+            or delete events in target calendar.
+    """
+
+    return (
+        build("calendar", "v3", credentials=CREDENTIALS, cache_discovery=False),
+        build("calendar", "v3", credentials=TARGET_CREDENTIALS, cache_discovery=False),
+    )
+
+
+def get_services() -> tuple[Resource, Resource]:
+    """Takes services from SERVICE_POOL. Builds new ones only if the pool is empty.
+
+    Services are used by one webhook at a time - their HTTP transport (httplib2)
+    is not thread-safe. Give them back with release_services() when the webhook is done.
+
+    Returns:
+        Service to retrieve events from main calendar and service to create, update,
+            or delete events in target calendar.
+    """
+
+    try:
+        return SERVICE_POOL.get_nowait()
+    except queue.Empty:
+        return build_services()
+
+
+def release_services(services: tuple[Resource, Resource]) -> None:
+    """Puts services back to SERVICE_POOL, so next webhook doesn't build them again.
+
+    Args:
+        services: Services taken with get_services().
+    """
+
+    SERVICE_POOL.put(services)
+
+
+def get_events_page(
+    service: Resource, calendar_id: str, updated_min: str, page_token: str
+) -> dict:
+    """Retrieves one page of events changed since 'updated_min' from the given calendar.
+
+    Only 'nextPageToken' and 'items' are requested - list metadata is not used.
+
+    Args:
+        service: The Google Calendar API service instance of the master calendar
+        calendar_id: The ID of the master calendar
+        updated_min: Lower bound for event's last modification time. In ISO format.
+        page_token: Token of the page to retrieve. Empty string for the first page.
+
+    Returns:
+        Events list response from the Google Calendar API.
+    """
+
+    return (
+        service.events()  # type: ignore
+        .list(
+            calendarId=calendar_id,
+            updatedMin=updated_min,
+            singleEvents=False,
+            maxResults=250,
+            pageToken=page_token,
+            fields=EVENTS_LIST_FIELDS,
+        )
+        .execute()
+    )
+
+
 def time_now_minus_seconds_iso(time_now: datetime, seconds: int = 10) -> str:
     """Checks actual time and subtract from it given seconds.
 
@@ -245,6 +396,32 @@ def check_if_event_type_is_default(event: dict) -> bool:
     return bool(event_type == "default")
 
 
+def classify_event(event: dict, config: ConfigLike) -> tuple[bool, bool, Optional[str]]:
+    """Checks event type, calendars in attendees and response status in one pass.
+
+    It gives the same results as check_if_event_type_is_default(event),
+    EventData.check_calendars_in_attendees(event, config) == "Both" and
+    EventData.get_attendee_response_status(event, config.calendar_id),
+    but goes through the attendees list only once (EventData.classify_attendees).
+
+    Args:
+        event: The event data dictionary.
+        config: Instance of configuration class to manage application settings.
+
+    Returns:
+        Tuple:
+            - True if event type is 'default', False otherwise. If False, then other
+                values are not checked (False, None).
+            - True if both CALENDAR_ID and TARGET_CALENDAR_ID are attendees.
+            - Response status of CALENDAR_ID attendee or None.
+    """
+
+    if event.get("eventType") != "default":
+        return False, False, None
+    calendars_in_attendees, response_status = EventData.classify_attendees(event, config)
+    return True, calendars_in_attendees == "Both", response_status
+
+
 def check_what_to_do_with_event(
     target_event: Optional[dict], status: str, response_status: Optional[str]
 ) -> str:
@@ -269,6 +446,7 @@ def check_what_to_do_with_event(
 
 # --- Run the channel creation when the app starts ---
 with app.app_context():
+    log.configure()
     config = Config()
     CREDENTIALS = config.create_token(
         config.token_path, config.credentials_path, CREDENTIALS
@@ -277,18 +455,23 @@ with app.app_context():
         AUTH_TOKEN: str = CREDENTIALS.token  # type: ignore[attr-defined]
     else:
         AUTH_TOKEN = ""
-        Logger().critical(
+        log.critical(
             "Error: CREDENTIALS is None. Check your config.ini and credentials.json files."
         )
     # If both calendars belong to the same user, then target_token == token
     if config.same_user:
-        data = config.token_path.read_bytes()
-        config.target_token_path.write_bytes(data)
+        shutil.copyfile(config.token_path, config.target_token_path)
     else:
         TARGET_CREDENTIALS = config.create_token(
             config.target_token_path, config.credentials_path, TARGET_CREDENTIALS
         )
 
+    # Services built at start are put to the pool and used by the first webhook.
+    try:
+        release_services(build_services())
+    except (HttpError, GoogleAuthError) as error:
+        log.critical("An error occurred during building the service: %s", error)
+
     notification_channel = NotificationChannel(
         config.calendar_id, config.webhook_url, AUTH_TOKEN
     )
@@ -6,21 +6,60 @@ Pip install requires:
     - google.auth.transport.requests
     - google.oauth2.credentials
     - google_auth_oauthlib.flow
-    - validator_collection
 """
 
 import configparser
 import os
 import json
+import re
+import shutil
 
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, Union
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import-untyped]
-from validator_collection import checkers  # type: ignore[import-untyped]
 from logger_class import Logger
 
+# Precompiled patterns used to validate values from config.ini.
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+URL_RE = re.compile(r"^https?://[^\s/?#]+\.[^\s/?#]+(?:[/?#]\S*)?$", re.IGNORECASE)
+
+
+def read_config_file(config_file_path: Path) -> configparser.ConfigParser:
+    """Parses configuration file.
+
+    It is called once per process - Config is a singleton and reads the file only when
+    its first instance is created. Restart the app to apply changes in 'config.ini'.
+
+    Args:
+        config_file_path: Path to 'config.ini'
+
+    Returns:
+        Parsed configuration.
+    """
+
+    config = configparser.ConfigParser()
+    # Whole file is read with one call and parsed from memory.
+    config.read_string(
+        config_file_path.read_text(encoding="utf-8"), source=str(config_file_path)
+    )
+    return config
+
+
+class ConfigSnapshot(NamedTuple):
+    """Read-only copy of Config fields used for every synchronized event.
+
+    It is created once per webhook by Config.snapshot() and passed to EventData methods
+    instead of Config.
+    """
+
+    calendar_id: str
+    target_calendar_id: str
+    prefix: Optional[str]
+    color: Optional[str]
+    suffix: Optional[str]
+
 
 # Implements Singleton pattern to ensure only one instance exists throughout the application.
 class Config:
@@ -48,20 +87,32 @@ class Config:
     This class contains following methods:
         - create_token(token_path, credentials_path, credentials, scopes) - 
             Creates the OAuth 2.0 token for accessing the Google Calendar API.
+        - snapshot() -
+            Returns ConfigSnapshot with fields used for every synchronized event.
     """
 
+    _instance: Optional["Config"] = None
+    _initialized: bool = False
+
+    def __new__(cls) -> "Config":
+        # Return the same instance every time, so config.ini is read and validated only once.
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self) -> None:
+        if self._initialized:
+            return
         self.folder_path, self.config_file_path = self.get_paths()
-        self.config = configparser.ConfigParser()
-        self.config.read(self.config_file_path)
+        self.config = read_config_file(self.config_file_path)
 
         self.scopes: list = json.loads(self.config.get("configuration", "SCOPES"))
         if not isinstance(self.scopes, list) or not all(
-            checkers.is_url(scope) for scope in self.scopes
+            URL_RE.match(scope) for scope in self.scopes
         ):
             raise ValueError("SCOPES must be a list of valid URLs.")
         self.calendar_id: str = self.config.get("configuration", "CALENDAR_ID")
-        if not checkers.is_email(self.calendar_id):
+        if not EMAIL_RE.match(self.calendar_id):
             raise ValueError(
                 f"Invalid CALENDAR_ID: {self.calendar_id}. "
                 "Must be a valid email address."
@@ -69,13 +120,13 @@ class Config:
         self.target_calendar_id: str = self.config.get(
             "configuration", "TARGET_CALENDAR_ID"
         )
-        if not checkers.is_email(self.target_calendar_id):
+        if not EMAIL_RE.match(self.target_calendar_id):
             raise ValueError(
                 f"Invalid TARGET_CALENDAR_ID: {self.target_calendar_id}. "
                 "Must be a valid email address."
             )
         self.webhook_url: str = self.config.get("configuration", "WEBHOOK_URL")
-        if not checkers.is_url(self.webhook_url) or not self.webhook_url.startswith(
+        if not URL_RE.match(self.webhook_url) or not self.webhook_url.startswith(
             "https://"
         ):
             raise ValueError(
@@ -105,6 +156,8 @@ class Config:
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.config.get(
             "configuration", "GOOGLE_APPLICATION_CREDENTIALS"
         )
+        # Set at the end - if validation fails, next Config() will read the file again.
+        self._initialized = True
 
     def create_token(
         self,
@@ -146,6 +199,17 @@ class Config:
 
         return credentials  # type: ignore[import-untyped]
 
+    def snapshot(self) -> ConfigSnapshot:
+        """Returns ConfigSnapshot with fields used for every synchronized event.
+
+        Returns:
+            ConfigSnapshot(calendar_id, target_calendar_id, prefix, color, suffix)
+        """
+
+        return ConfigSnapshot(
+            self.calendar_id, self.target_calendar_id, self.prefix, self.color, self.suffix
+        )
+
     def get_paths(self) -> tuple[Path, Path]:
         """Function get absolute path to folder and config.ini and checks if file exists.
 
@@ -165,7 +229,12 @@ class Config:
         return folder_path, config_file_path
 
 
+# Config or its snapshot - EventData methods use only fields available in both.
+ConfigLike = Union[Config, ConfigSnapshot]
+
+
 if __name__ == "__main__":
+    Logger.configure()
     config = Config()
     CREDENTIALS = config.create_token(
         config.token_path, config.credentials_path, credentials=None
@@ -176,12 +245,11 @@ if __name__ == "__main__":
         AUTH_TOKEN = ""
         Logger().error(
             "Error: CREDENTIALS is None. Check config.ini and credentials.json files.",
-            __name__,
+            exc_info=False,
         )
     # If both calendars belong to the same user, then target_token == token
     if config.same_user:
-        data = config.token_path.read_bytes()
-        config.target_token_path.write_bytes(data)
+        shutil.copyfile(config.token_path, config.target_token_path)
     else:
         TARGET_CREDENTIALS = config.create_token(
             config.target_token_path, config.credentials_path, credentials=None
@@ -4,14 +4,287 @@ This class allows user to create, modyfi or delete events in Google Calendar.
 
 Script requires googleapiclient.errors.
 
-This module contains class EventData.
+This module contains classes EventData and BatchQueue, functions reset_batch_queue,
+current_batch_queue and execute_batch and retry helpers (is_retryable, backoff_delay, reset_retry_budget, retry_delay, retry_http,
+execute_request).
 """
 
-from typing import Optional
+import functools
+import random
+import threading
+import time
+from typing import Any, Callable, ClassVar, Optional, TypeVar
 from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
-from logger_class import Logger
-from project_config_class import Config
-import googleapiclient.discovery
+from logger_class import log
+from project_config_class import ConfigLike
+import googleapiclient.discovery  # type: ignore[import-untyped]
+from googleapiclient.discovery import Resource  # type: ignore[import-untyped]
+
+BATCH_MAX_SIZE: int = 50  # Google Calendar API limit of requests in one batch
+RETRY_MAX: int = 5  # How many times failed request or rate limited operations are sent again
+RETRY_BACKOFF_BASE: float = 0.5  # Seconds to wait before the first retry
+RETRY_BACKOFF_CAP: float = 8.0  # Maximal wait between retries in seconds
+RETRY_BACKOFF_JITTER: float = 0.1  # Random seconds added to each wait
+RETRY_TIME_BUDGET: float = 10.0  # Maximal seconds of waiting for retries in one webhook
+RATE_LIMIT_STATUS: int = 429  # Too Many Requests
+FORBIDDEN_STATUS: int = 403  # Google also uses it for (user) rate limit exceeded
+# Statuses of transient errors - request is sent again after backoff.
+RETRY_STATUSES = frozenset({RATE_LIMIT_STATUS, 500, 502, 503, 504})
+# Result of EventData.check_calendars_in_attendees() for
+# (calendar_id in attendees, target_calendar_id in attendees).
+CALENDARS_IN_ATTENDEES = {(True, True): "Both", (True, False): "Main", (False, True): "Target"}
+# Keys removed from event data before creating or updating event in the target calendar.
+# See EventData.pop_unnecessary_keys().
+KEYS_TO_POP = frozenset(
+    {
+        "created",
+        "creator",
+        "etag",
+        "htmlLink",
+        "iCalUID",
+        "kind",
+        "originalStartTime",
+        "organizer",
+        "recurringEventId",
+        "sequence",
+        "updated",
+    }
+)
+
+# Called with API response or with exception if the request failed.
+OperationCallback = Callable[[Optional[dict], Optional[Exception]], None]
+# (method of events resource - "insert" | "update" | "delete", its kwargs, callback)
+Operation = tuple[str, dict[str, Any], OperationCallback]
+
+
+class BatchQueue:
+    """Thread-safe queue of operations which are sent to the API in batch requests.
+
+    This class contains following methods:
+        - add(verb, kwargs, callback) -
+            Adds operation to the queue and returns number of queued operations.
+        - pop_all() -
+            Removes and returns all queued operations.
+    """
+
+    def __init__(self) -> None:
+        self._operations: list[Operation] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, verb: str, kwargs: dict[str, Any], callback: OperationCallback) -> int:
+        """Adds operation to the queue.
+
+        Args:
+            verb: Method of the events resource - "insert", "update" or "delete"
+            kwargs: Arguments of the method
+            callback: Function called with the response or exception
+
+        Returns:
+            Number of queued operations, including the added one.
+        """
+
+        with self._lock:
+            self._operations.append((verb, kwargs, callback))
+            return len(self._operations)
+
+    def pop_all(self) -> list[Operation]:
+        """Removes and returns all queued operations."""
+
+        with self._lock:
+            operations, self._operations = self._operations, []
+        return operations
+
+
+# Queue of operations of the current webhook - per thread (webhook), like RETRY_BUDGET.
+# Operations of one webhook are never sent by another one.
+BATCH_QUEUES = threading.local()
+
+
+def reset_batch_queue() -> BatchQueue:
+    """Starts new, empty queue of operations in this thread. Called for every webhook.
+
+    Operations left by the previous webhook in this thread (e.g. after an error)
+    are dropped with a warning - they are not sent by another webhook.
+
+    Returns:
+        The new queue.
+    """
+
+    old_queue: Optional[BatchQueue] = getattr(BATCH_QUEUES, "queue", None)
+    if old_queue:
+        log.warning("Dropping %s operations not sent by previous webhook.", len(old_queue))
+    BATCH_QUEUES.queue = BatchQueue()
+    return BATCH_QUEUES.queue
+
+
+def current_batch_queue() -> BatchQueue:
+    """Returns queue of operations of the current webhook (thread)."""
+
+    batch_queue: Optional[BatchQueue] = getattr(BATCH_QUEUES, "queue", None)
+    if batch_queue is None:
+        batch_queue = reset_batch_queue()
+    return batch_queue
+
+T = TypeVar("T")
+
+# Seconds of waiting for retries left in the current webhook - per thread (webhook).
+RETRY_BUDGET = threading.local()
+
+
+def is_retryable(error: Any) -> bool:
+    """Checks if the request failed with a transient error and can be sent again.
+
+    403 is retried only for "rateLimitExceeded" and "userRateLimitExceeded" reasons.
+    Other 403 errors (e.g. no access to the calendar) won't pass on retry.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        True for rate limits and server errors.
+    """
+
+    if not isinstance(error, HttpError):
+        return False
+    status = error.resp.status
+    if status in RETRY_STATUSES:
+        return True
+    return status == FORBIDDEN_STATUS and b"ratelimitexceeded" in (error.content or b"").lower()
+
+
+def backoff_delay(attempt: int) -> float:
+    """Returns seconds to wait before the retry - exponential backoff with jitter.
+
+    Args:
+        attempt: Number of the retry, starting from 0
+    """
+
+    return min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt) + (
+        random.random() * RETRY_BACKOFF_JITTER
+    )
+
+
+def reset_retry_budget(seconds: Optional[float] = None) -> None:
+    """Starts new budget of waiting for retries in this thread. Called for every webhook.
+
+    Retries of single requests, batch requests and operations in flush() share
+    the budget, so together they never wait longer than RETRY_TIME_BUDGET seconds.
+
+    Args:
+        seconds: Budget in seconds. RETRY_TIME_BUDGET if None.
+    """
+
+    RETRY_BUDGET.seconds = RETRY_TIME_BUDGET if seconds is None else seconds
+
+
+def retry_delay(attempt: int) -> Optional[float]:
+    """Returns seconds to wait before the retry and takes them from the retry budget.
+
+    Args:
+        attempt: Number of the retry, starting from 0
+
+    Returns:
+        Delay from backoff_delay(attempt) or None if the retry limit is reached
+            or the delay doesn't fit in the budget left in this thread.
+    """
+
+    if attempt >= RETRY_MAX:
+        return None
+    if getattr(RETRY_BUDGET, "seconds", None) is None:
+        reset_retry_budget()
+    delay = backoff_delay(attempt)
+    if delay > RETRY_BUDGET.seconds:
+        return None
+    RETRY_BUDGET.seconds -= delay
+    return delay
+
+
+def retry_http(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator - calls the function again if it raised transient HttpError.
+
+    The function is called at most RETRY_MAX + 1 times and only while waits fit in
+    the retry budget (see retry_delay()). The last error is raised.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except HttpError as e:
+                if not is_retryable(e):
+                    raise
+                delay = retry_delay(attempt)
+                if delay is None:
+                    raise
+                log.warning("%s. Retrying in %.2f s.", e, delay)
+                time.sleep(delay)
+                attempt += 1
+
+    return wrapper
+
+
+@retry_http
+def execute_request(request: Any) -> Any:
+    """Executes API request (or batch request), retrying transient errors."""
+
+    return request.execute()
+
+
+def execute_batch(
+    target_service: googleapiclient.discovery.Resource, operations: list[Operation]
+) -> list[tuple[Operation, HttpError]]:
+    """Sends operations in one batch request and calls their callbacks.
+
+    Args:
+        target_service: The Google Calendar API service instance
+                            used to interact with the calendar
+        operations: Up to BATCH_MAX_SIZE operations
+
+    If the whole batch request fails (HttpError, timeout, connection or auth error),
+    the error is logged and passed to callbacks of all operations which didn't get
+    the response yet - none of them is dropped silently.
+
+    Returns:
+        Operations rejected because of rate limits or server errors with their errors.
+            Their callbacks are not called.
+    """
+
+    rate_limited: list[tuple[Operation, HttpError]] = []
+    # Indexes of operations whose callbacks were already called.
+    done: set[int] = set()
+
+    def batch_callback(request_id: str, response: Optional[dict], exception: Any) -> None:
+        index = int(request_id)
+        operation = operations[index]
+        if is_retryable(exception):
+            rate_limited.append((operation, exception))
+            return
+        done.add(index)
+        operation[2](response, exception)
+
+    batch = target_service.new_batch_http_request(callback=batch_callback)  # type: ignore
+    events = EventData.events_resource(target_service)
+    for request_id, (verb, kwargs, _) in enumerate(operations):
+        batch.add(getattr(events, verb)(**kwargs), request_id=str(request_id))
+    try:
+        execute_request(batch)
+    except HttpError as e:
+        log.error("HttpError executing batch request: %s", e)
+        error: Exception = e
+    except Exception as e:
+        log.error("Error executing batch request: %s", e)
+        error = e
+    else:
+        return rate_limited
+    for index, (_, _, callback) in enumerate(operations):
+        if index not in done:
+            callback(None, error)
+    return []
 
 
 class EventData:
@@ -24,13 +297,19 @@ class EventData:
                         which is populated by the get_event details method.
 
     This class contains following methods:
+        - events_resource(target_service) -
+            Returns events resource of the service. It's created only once for each service.
+        - bind(target_service) -
+            Creates and caches events resource of the service before it's used.
+        - enqueue(target_service, verb, kwargs, callback) -
+            Queues operation and sends the queue as soon as it fills one batch request.
         - create_new_event(calendar_id, target_service, send_updates) -
             Creates a new event in the specified calendar using the Google Calendar API.
         - update_event(target_service, target_event_id) -
             Updates an existing event in the target calendar using the Google Calendar API.
         - get_event_details(event) -
-            Copies all event data to self.data and modifies or adds additional information
-            from config.ini.
+            Copies event data without unnecessary keys to self.data and modifies or adds
+            additional information from config.ini.
         - pop_unnecessary_keys() -
             Removes keys from the event data that are not required
             or may cause errors during event creation or update.
@@ -38,14 +317,78 @@ class EventData:
             Get invitation response status if there are attendees.
         - check_if_id_exists_in_target_calendar(event_id, target_service) -
             Checks if an event with the given ID exists in the target calendar.
+        - get_events_from_target_calendar(event_ids, target_service, config, max_size) -
+            Gets events with the given IDs from the target calendar using batch requests.
         - delete_event(calendar_id, event_id, target_service) -
             Deletes an event from the specified calendar using the Google Calendar API.
         - check_calendars_in_attendees(event) -
             Check if main or target calendars are in the event attendees.
+        - classify_attendees(event, config) -
+            Check calendars in the event attendees and response status in one pass.
+        - flush(target_service, max_size) -
+            Sends all queued create, update and delete operations in batch requests.
     """
 
-    def __init__(self):
-        self.data = {}
+    # (service, its events resource) - resource is built once per service.
+    # Kept per thread, like the services (see project.get_services()).
+    _events_cache: ClassVar[threading.local] = threading.local()
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    @classmethod
+    def events_resource(cls, target_service: Resource) -> Resource:
+        """Returns events resource of the service. It's created only once for each service.
+
+        Args:
+            target_service: The Google Calendar API service instance
+                                used to interact with the calendar
+
+        Returns:
+            Result of target_service.events().
+        """
+
+        cached: Optional[tuple[Resource, Resource]] = getattr(
+            cls._events_cache, "resource", None
+        )
+        if cached is None or cached[0] is not target_service:
+            cached = (target_service, target_service.events())  # type: ignore
+            cls._events_cache.resource = cached
+        return cached[1]
+
+    @classmethod
+    def bind(cls, target_service: Resource) -> None:
+        """Creates and caches events resource of the service before it's used.
+
+        Args:
+            target_service: The Google Calendar API service instance
+                                used to interact with the calendar
+        """
+
+        cls.events_resource(target_service)
+
+    @staticmethod
+    def enqueue(
+        target_service: googleapiclient.discovery.Resource,
+        verb: str,
+        kwargs: dict[str, Any],
+        callback: OperationCallback,
+    ) -> None:
+        """Queues operation and sends the queue as soon as it fills one batch request.
+
+        Full batch is sent right away, so there are never more than BATCH_MAX_SIZE
+        operations waiting. The rest is sent by EventData.flush() after the page.
+
+        Args:
+            target_service: The Google Calendar API service instance
+                                used to interact with the calendar
+            verb: Method of the events resource - "insert", "update" or "delete"
+            kwargs: Arguments of the method
+            callback: Function called with the response or exception
+        """
+
+        if current_batch_queue().add(verb, kwargs, callback) >= BATCH_MAX_SIZE:
+            EventData.flush(target_service)
 
     def create_new_event(
         self,
@@ -55,7 +398,8 @@ class EventData:
     ) -> None:
         """Creates a new event in the specified calendar.
 
-        This method uses the Google Calendar API to insert a new event into the target calendar.
+        This method queues insert of a new event into the target calendar.
+        The request is sent to the Google Calendar API by EventData.flush().
         It takes event data from the instance's 'data' - created by get_event_details method.
         It also supports attachments and conference data,
             and by default does not send updates to attendees.
@@ -71,47 +415,56 @@ class EventData:
                     - none
         """
 
-        Logger().debug(
-            f"Creating event with summary: {self.data.get('summary', 'No summary')}, "
-            f"ID: {self.data.get('id', 'Unknown ID')}.",
-            __name__,
+        data = self.data
+        log.debug(
+            "Creating event with summary: %s, ID: %s.",
+            data.get("summary", "No summary"),
+            data.get("id", "Unknown ID"),
         )
-        try:
-            event = (
-                target_service.events()  # type: ignore
-                .insert(
-                    calendarId=calendar_id,
-                    body=self.data,
-                    conferenceDataVersion=1,
-                    supportsAttachments=True,
-                    sendUpdates=send_updates,
+
+        def callback(response: Optional[dict], exception: Optional[Exception]) -> None:
+            if exception is None:
+                log.info(
+                    "Event created: %s\n%s\n", response.get("htmlLink"), data  # type: ignore
+                )
+            elif isinstance(exception, HttpError):
+                log.error(
+                    "HttpError creating event, ID: %s error: %s.",
+                    data.get("id", "Unknown ID"),
+                    exception,
+                    exc_info=exception,
+                )
+            else:
+                log.error(
+                    "Error creating event, ID: %s, err: %s.",
+                    data.get("id", "Unknown ID"),
+                    exception,
+                    exc_info=exception,
                 )
-                .execute()
-            )
-            Logger().info(
-                f"Event created: {event.get('htmlLink')}\n{self.data}\n", __name__
-            )
-        except HttpError as e:
-            Logger().error(
-                f"HttpError creating event, ID: {self.data.get('id', 'Unknown ID')}",
-                f"error: {e}.",
-                __name__,
-            )
-        except Exception as e:
-            Logger.error(
-                f"Error creating event, ID: {self.data.get('id', 'Unknown ID')}, err: {e}.",
-                __name__,
-            )
+
+        EventData.enqueue(
+            target_service,
+            "insert",
+            {
+                "calendarId": calendar_id,
+                "body": data,
+                "conferenceDataVersion": 1,
+                "supportsAttachments": True,
+                "sendUpdates": send_updates,
+            },
+            callback,
+        )
 
     def update_event(
         self,
         target_service: googleapiclient.discovery.Resource,
         target_event_id: str,
-        config: Config,
+        config: ConfigLike,
     ) -> None:
         """Updates existing event in target calendar.
 
-        This method uses the Google Calendar API to update event in the target calendar.
+        This method queues update of the event in the target calendar.
+        The request is sent to the Google Calendar API by EventData.flush().
         It takes event data from the instance's 'data' attribute - created by get_event_details.
         If the 'target_event_id' is not found in the target calendar, error is printed.
         It also supports attachments and conference data, and does not send updates to attendees.
@@ -124,31 +477,44 @@ class EventData:
                 Google Calendar API tokens.
         """
 
-        try:
-            target_service.events().update(  # type: ignore
-                calendarId=config.target_calendar_id,
-                eventId=target_event_id,
-                body=self.data,
-                conferenceDataVersion=1,
-                supportsAttachments=True,
-                sendUpdates="none",
-            ).execute()
-            Logger().info(
-                f"Event: {self.data.get('summary', 'No summary')}, "
-                f"ID: {target_event_id} has been updated.",
-                __name__,
-            )
-        except Exception as e:
-            Logger.error(
-                f"Error updating event {self.data.get('summary', 'No summary')}, "
-                f"ID: {target_event_id}: {e}",
-                __name__,
-            )
+        data = self.data
+
+        def callback(response: Optional[dict], exception: Optional[Exception]) -> None:
+            if exception is None:
+                log.info(
+                    "Event: %s, ID: %s has been updated.",
+                    data.get("summary", "No summary"),
+                    target_event_id,
+                )
+            else:
+                log.error(
+                    "Error updating event %s, ID: %s: %s",
+                    data.get("summary", "No summary"),
+                    target_event_id,
+                    exception,
+                    exc_info=exception,
+                )
+
+        EventData.enqueue(
+            target_service,
+            "update",
+            {
+                "calendarId": config.target_calendar_id,
+                "eventId": target_event_id,
+                "body": data,
+                "conferenceDataVersion": 1,
+                "supportsAttachments": True,
+                "sendUpdates": "none",
+            },
+            callback,
+        )
 
-    def get_event_details(self, event: dict[str, str], config: Config) -> None:
-        """Copies all event data to self.data and modify or add information from config.ini.
+    def get_event_details(self, event: dict[str, Any], config: ConfigLike) -> None:
+        """Copies event data to self.data and modify or add information from config.ini.
 
         It is used to prepare event data for creating or updating an event in the target calendar.
+        Keys removed by pop_unnecessary_keys() (KEYS_TO_POP) are skipped while copying,
+        so there is no need to call it afterwards.
         This method modifies the event data by adding a prefix to the summary if in the config.ini.
         It also adds a colorId if it exists in the config.ini and appends a description -
             information that it was created by a script - if it is not already present.
@@ -159,7 +525,7 @@ class EventData:
                 Google Calendar API tokens.
         """
 
-        self.data = event.copy()
+        self.data = {key: value for key, value in event.items() if key not in KEYS_TO_POP}
         # Add prefix to summary if it exists in config.ini
         if config.prefix:
             event_summary = event.get("summary", "")
@@ -170,14 +536,12 @@ class EventData:
             self.data["colorId"] = config.color
         # Add description if it already is not added.
         description_added = config.suffix
-        description = event.get("description", "")
         # Checks if already added - this is to avoid adding the same description multiple times.
         if description_added:
+            description = event.get("description") or ""
             if description_added not in description:
                 # strip() is used to remove added \n\n if originaly there is no description.
-                self.data["description"] = (
-                    description + "\n\n" + description_added
-                ).strip()
+                self.data["description"] = "\n\n".join((description, description_added)).strip()
 
     def pop_unnecessary_keys(self) -> None:
         """Removes keys from the event data that are not required or may cause errors.
@@ -191,31 +555,16 @@ class EventData:
                     These are system-generated fields that are not modifiable.
         - "iCalUID": This is a unique identifier for the event in iCalendar format.
                     Can't use if 'id' is passed to the API.
+
+        Keys (KEYS_TO_POP) are removed from self.data in place.
         """
 
-        keys_to_pop = (
-            "created",
-            "creator",
-            "etag",
-            "htmlLink",
-            "iCalUID",
-            "kind",
-            "originalStartTime",
-            "organizer",
-            "recurringEventId",
-            "sequence",
-            "updated",
-        )
-        try:
-            self.data = {  # type: ignore
-                key: value for key, value in self.data.items() if key not in keys_to_pop  # type: ignore
-            }
-        except Exception as e:
-            Logger().error(f"Exception pop_unnecessary_keys: {e}", __name__)
+        for key in KEYS_TO_POP:
+            self.data.pop(key, None)
 
     @staticmethod
     def get_attendee_response_status(
-        event: dict[str, str], email: str
+        event: dict[str, Any], email: str
     ) -> Optional[str]:
         """Get invitation response status if there are attendees.
 
@@ -236,33 +585,17 @@ class EventData:
                 create new event or do nothing if event already created
         """
 
-        try:
-            attendees = event.get("attendees")
-            response_status = None
-            if attendees is not None:
-                for attendee in attendees:
-                    if attendee.get("email") == email:  # type: ignore
-                        return attendee.get("responseStatus", None)  # type: ignore
-            return response_status
-        except AttributeError as e:
-            Logger().error(
-                f"AttributeError getting response status. ID: {event.get('id')} - {e}.",
-                __name__,
-            )
-            return None
-        except Exception as e:
-            Logger().error(
-                f"Exception getting response status. ID: {event.get('id')} - {e}.",
-                __name__,
-            )
-            return None
+        for attendee in event.get("attendees") or ():
+            if attendee.get("email") == email:
+                return attendee.get("responseStatus")
+        return None
 
     @staticmethod
     def check_if_id_exists_in_target_calendar(
         event_id: str,
         target_service: googleapiclient.discovery.Resource,
-        config: Config,
-    ) -> Optional[dict[str, str]]:
+        config: ConfigLike,
+    ) -> Optional[dict[str, Any]]:
         """Checks if an event with the given ID exists in the target calendar.
 
         Args:
@@ -278,18 +611,75 @@ class EventData:
         """
 
         try:
-            target_event = (
-                target_service.events()  # type: ignore
-                .get(calendarId=config.target_calendar_id, eventId=event_id)
-                .execute()
+            target_event = execute_request(
+                EventData.events_resource(target_service).get(
+                    calendarId=config.target_calendar_id, eventId=event_id
+                )
             )
             return target_event
         except HttpError:
-            Logger.info(
-                f"Event ID: {event_id} doesn't exist in target calendar", __name__
-            )
+            log.info("Event ID: %s doesn't exist in target calendar", event_id)
             return None
 
+    @staticmethod
+    def get_events_from_target_calendar(
+        event_ids: list[str],
+        target_service: googleapiclient.discovery.Resource,
+        config: ConfigLike,
+        max_size: int = BATCH_MAX_SIZE,
+    ) -> dict[str, Optional[dict]]:
+        """Gets events with the given IDs from the target calendar using batch requests.
+
+        Up to 'max_size' events are requested in one HTTP request, so checking a page of
+        events doesn't cost one round-trip per event. If the request for an event fails
+        with other error than 404 Not Found, the event is checked again with
+        check_if_id_exists_in_target_calendar().
+
+        Args:
+            event_ids: The event IDs to check in the target calendar
+            target_service (service instance): The Google Calendar API service instance
+                                used to interact with the calendar
+            config (instance): Instance of configuration class to manage application settings and
+                Google Calendar API tokens.
+            max_size: Maximum number of requests in one batch request.
+
+        Returns:
+            Dictionary event ID -> event data from the target calendar if it exists, else None.
+        """
+
+        target_events: dict[str, Optional[dict]] = dict.fromkeys(event_ids)
+        to_check_again: list[str] = []
+
+        def callback(request_id: str, response: Optional[dict], exception: Any) -> None:
+            if exception is None:
+                target_events[request_id] = response
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                log.info("Event ID: %s doesn't exist in target calendar", request_id)
+            else:
+                to_check_again.append(request_id)
+
+        unique_ids = list(target_events)
+        events = EventData.events_resource(target_service)
+        target_calendar_id = config.target_calendar_id
+        for start in range(0, len(unique_ids), max_size):
+            chunk = unique_ids[start : start + max_size]
+            batch = target_service.new_batch_http_request(callback=callback)  # type: ignore
+            for event_id in chunk:
+                batch.add(
+                    events.get(calendarId=target_calendar_id, eventId=event_id),
+                    request_id=event_id,
+                )
+            try:
+                execute_request(batch)
+            except HttpError as e:
+                log.error("HttpError executing batch request: %s", e)
+                to_check_again.extend(chunk)
+        for event_id in to_check_again:
+            target_events[event_id] = EventData.check_if_id_exists_in_target_calendar(
+                event_id, target_service, config
+            )
+        return target_events
+
     @staticmethod
     def delete_event(
         calendar_id: str,
@@ -298,6 +688,8 @@ class EventData:
     ) -> None:
         """Deletes an event from the specified calendar.
 
+        The request is queued and sent to the Google Calendar API by EventData.flush().
+
         Args:
             calendar_id: The ID of the calendar from which to delete the event
             event_id: The ID of the event to delete
@@ -305,19 +697,69 @@ class EventData:
                                 used to interact with the calendar
         """
 
-        try:
-            target_service.events().delete(  # type: ignore
-                calendarId=calendar_id, eventId=event_id
-            ).execute()
-            Logger().info(f"Event ID: {event_id} deleted", __name__)
-        except HttpError as e:
-            Logger().error(f"HttpError deleting event {event_id}: {e}.", __name__)
-        except Exception as e:
-            Logger().error(f"Error deleting event {event_id}: {e}.", __name__)
+        def callback(response: Optional[dict], exception: Optional[Exception]) -> None:
+            if exception is None:
+                log.info("Event ID: %s deleted", event_id)
+            elif isinstance(exception, HttpError):
+                log.error(
+                    "HttpError deleting event %s: %s.", event_id, exception, exc_info=exception
+                )
+            else:
+                log.error("Error deleting event %s: %s.", event_id, exception, exc_info=exception)
+
+        EventData.enqueue(
+            target_service, "delete", {"calendarId": calendar_id, "eventId": event_id}, callback
+        )
+
+    @staticmethod
+    def flush(
+        target_service: googleapiclient.discovery.Resource,
+        max_size: int = BATCH_MAX_SIZE,
+    ) -> None:
+        """Sends all queued create, update and delete operations to the Google Calendar API.
+
+        Operations are sent as batch requests - up to 'max_size' operations in one HTTP
+        request. Operations rejected because of rate limits or server errors are sent again
+        after exponential backoff with jitter, at most RETRY_MAX times and only while waits
+        fit in the retry budget of the webhook (see retry_delay()).
+
+        Args:
+            target_service: The Google Calendar API service instance
+                                used to interact with the calendar
+            max_size: Maximum number of operations in one batch request.
+                Google Calendar API accepts up to 50.
+        """
+
+        operations = current_batch_queue().pop_all()
+        for attempt in range(RETRY_MAX + 1):
+            if not operations:
+                return
+            if attempt:
+                delay = retry_delay(attempt - 1)
+                if delay is None:
+                    log.warning(
+                        "Retry time budget exhausted. %s operations are not sent again.",
+                        len(operations),
+                    )
+                    break
+                log.warning(
+                    "Rate limit exceeded or server error. Retrying %s operations in %.2f s.",
+                    len(operations),
+                    delay,
+                )
+                time.sleep(delay)
+            rate_limited: list[tuple[Operation, HttpError]] = []
+            for start in range(0, len(operations), max_size):
+                rate_limited.extend(
+                    execute_batch(target_service, operations[start : start + max_size])
+                )
+            operations = [operation for operation, _ in rate_limited]
+        for (_, _, callback), error in rate_limited:
+            callback(None, error)
 
     @staticmethod
     def check_calendars_in_attendees(
-        event: dict[str, str], config: Config
+        event: dict[str, Any], config: ConfigLike
     ) -> Optional[str]:
         """Check if main or target calendars are in the event attendees.
 
@@ -329,6 +771,9 @@ class EventData:
         then return "Main" or "Target" and create or update the event.
         If none of the calendars are in the event attendees, then return None.
 
+        Kept for backward compatibility - classify_attendees() also returns
+        the response status in the same pass over attendees.
+
         Args:
             event (dict): The event data
             config (instance): Instance of configuration class to manage application settings and
@@ -339,29 +784,46 @@ class EventData:
             None: If neither calendar is in the event attendees
         """
 
+        return EventData.classify_attendees(event, config)[0]
+
+    @staticmethod
+    def classify_attendees(
+        event: dict[str, Any], config: ConfigLike
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Check calendars in the event attendees and response status in one pass.
+
+        It gives the same results as check_calendars_in_attendees(event, config) and
+        get_attendee_response_status(event, config.calendar_id), but goes through
+        the attendees list only once.
+
+        Args:
+            event (dict): The event data
+            config (instance): Instance of configuration class to manage application settings and
+                Google Calendar API tokens.
+
+        Returns:
+            tuple:
+                - "Both" | "Main" | "Target" or None if neither calendar is in the event attendees
+                - Response status of CALENDAR_ID attendee or None
+        """
+
+        calendar_id = config.calendar_id
+        target_calendar_id = config.target_calendar_id
         calendar_id_in_attendees = False
         target_calendar_id_in_attendees = False
-        try:
-            attendees = event.get("attendees", [])  # type: ignore
-            if not attendees:
-                return None
-            for attendee in attendees:
-                if attendee.get("email", "") == config.calendar_id:  # type: ignore
+        response_status = None
+        for attendee in event.get("attendees") or ():
+            email = attendee.get("email")
+            if email == calendar_id:
+                if not calendar_id_in_attendees:
                     calendar_id_in_attendees = True
-                if attendee.get("email", "") == config.target_calendar_id:  # type: ignore
-                    target_calendar_id_in_attendees = True
-
+                    response_status = attendee.get("responseStatus")
+            elif email == target_calendar_id:
+                target_calendar_id_in_attendees = True
+            # Both calendars found - the rest of attendees doesn't matter.
             if calendar_id_in_attendees and target_calendar_id_in_attendees:
-                return "Both"
-            if calendar_id_in_attendees and not target_calendar_id_in_attendees:
-                return "Main"
-            if not calendar_id_in_attendees and target_calendar_id_in_attendees:
-                return "Target"
-            return None
-        except Exception as e:
-            Logger().error(
-                f"Error checking attendees for event ID: {event.get('id')}. "
-                f"Summary: {event.get('summary', 'No summary')} - {e}",
-                __name__,
-            )
-            return None
+                break
+        location = CALENDARS_IN_ATTENDEES.get(
+            (calendar_id_in_attendees, target_calendar_id_in_attendees)
+        )
+        return location, response_status
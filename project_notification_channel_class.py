@@ -3,12 +3,36 @@
 This module manages notification channels for Google Calendar API.
 """
 
-import uuid
+import logging
 from datetime import datetime, timedelta
+from secrets import token_hex
 
 import requests  # type: ignore[import-untyped]
 from flask import request
-from logger_class import Logger # type: ignore[import-not-found]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
+from logger_class import log # type: ignore[import-not-found]
+
+# One session for all requests - TCP and TLS connections are reused (Keep-Alive).
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            backoff_jitter=0.1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Minimal time between processed notifications - created once, not on every request.
+_ONE_SEC = timedelta(seconds=1)
 
 
 class NotificationChannel:
@@ -22,7 +46,8 @@ class NotificationChannel:
         calendar_id (str): The ID of the calendar to create the notification channel for.
         webhook_url (str): The URL to which notifications will be sent.
         auth_token (str): The OAuth 2.0 token for authentication.
-        channel_id (str): A unique identifier for the notification channel, generated using UUID.
+        channel_id (str): A unique identifier for the notification channel, 32 random hex chars.
+        headers (dict): HTTP headers with the authorization token, built once per instance.
     
     This class contains following methods:
         - create_notification_channel() - 
@@ -42,13 +67,17 @@ class NotificationChannel:
             webhook_url: The URL to which notifications will be sent
                                 Expected format: HTTPS URL
             auth_token: The OAuth 2.0 token for authentication
-            channel_id (str): A unique identifier for the notification channel, generated using UUID
+            channel_id (str): A unique identifier for the notification channel, 32 random hex chars
         """
 
         self.calendar_id = calendar_id
         self.webhook_url = webhook_url
         self.auth_token = auth_token
-        self.channel_id = str(uuid.uuid4())  # Generate a unique channel ID
+        self.channel_id = token_hex(16)  # Generate a unique channel ID (32 hex characters)
+        self.headers = {
+            "Authorization": f"Bearer {self.auth_token}",
+            "Content-Type": "application/json",
+        }
 
     def create_notification_channel(self) -> dict:
         """Creates a notification channel for a given calendar.
@@ -63,24 +92,21 @@ class NotificationChannel:
         """
 
         url = f"https://www.googleapis.com/calendar/v3/calendars/{self.calendar_id}/events/watch"
-        headers = {
-            "Authorization": f"Bearer {self.auth_token}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "id": self.channel_id,
             "type": "web_hook",
             "address": self.webhook_url,
         }
 
-        response = requests.post(url, headers=headers, json=payload, timeout=2)
+        response = SESSION.post(url, headers=self.headers, json=payload, timeout=2)
 
         if response.status_code == 200:
-            Logger().info("Notification channel created successfully!", __name__)
-            Logger().debug(kwargs=response.json())
+            log.info("Notification channel created successfully!")
+            if log.logger.isEnabledFor(logging.DEBUG):
+                log.debug("%s", response.json())
             return response.json()
-        Logger().info("Notification channel HAS NOT BEEN created.", __name__)
-        Logger().warning(kwargs=response.json())
+        log.info("Notification channel HAS NOT BEEN created.")
+        log.warning("%s", response.json())
         return response.json()
 
     @staticmethod
@@ -102,25 +128,24 @@ class NotificationChannel:
             HTTP status code indicating the result of the validation.
         """
 
-        if last_update_timestamp > (time_now - timedelta(seconds=1)):
-            Logger().debug("208 - Already Reported", __name__)
+        if last_update_timestamp > time_now - _ONE_SEC:
+            log.debug("208 - Already Reported")
             return "208"  # Already Reported
         if request.method != "POST":
-            Logger().warning("405 - Method Not Allowed", __name__)
+            log.warning("405 - Method Not Allowed")
             return "405"  # Method Not Allowed
 
         # print(f"Full headers: {request.headers}")  # Keep for debugging
         resource_state = request.headers.get("X-Goog-Resource-State")
         if resource_state == "sync":
-            Logger().debug("This is a sync message.", __name__)
+            log.debug("This is a sync message.")
             return "200"  # OK
         if resource_state == "exists":
             return "exists"
         if resource_state is None:
-            Logger().warning("No resource state in headers.", __name__)
+            log.warning("No resource state in headers.")
             return "400"  # Bad Request
-        Logger().warning(
-            f"Resource state: {resource_state}. "
-            "Waiting for resource state == 'exists'.", __name__
+        log.warning(
+            "Resource state: %s. Waiting for resource state == 'exists'.", resource_state
         )
         return "202"  # Accepted, waiting for resource state to be 'exists'
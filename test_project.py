@@ -1,13 +1,28 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+import logging
+import threading
 import pytest  # type: ignore
+from flask import Flask
 
+import project
 from project import (
     time_now_minus_seconds_iso,
     check_if_event_type_is_default,
+    classify_event,
     check_what_to_do_with_event,
 )
+from googleapiclient.errors import HttpError  # type: ignore[import-untyped]
+import project_event_data
 from project_event_data import EventData
-from project_config_class import Config
+from project_config_class import Config, EMAIL_RE, URL_RE
+from project_notification_channel_class import NotificationChannel
+from logger_class import (
+    Logger,
+    CachedFormatter,
+    FastRotatingFileHandler,
+    LOG_FORMAT,
+    DATE_FORMAT,
+)
 
 event1 = {
     "kind": "calendar#event",
@@ -81,6 +96,30 @@ def test_get_event_details(monkeypatch):
     event_data.get_event_details(event1, config)
     assert event_data.data["summary"] == "[TEST] CS50P"
     assert event_data.data["colorId"] == "11"
+    assert "etag" not in event_data.data
+
+
+def test_get_event_details_suffix(monkeypatch):
+    event_data = EventData()
+    config = Config()
+    monkeypatch.setattr(config, "suffix", "Created by script")
+    event_data.get_event_details(event1, config)
+    assert event_data.data["description"] == "Created by script"
+    event_data.get_event_details({**event1, "description": "Notes"}, config)
+    assert event_data.data["description"] == "Notes\n\nCreated by script"
+    event_data.get_event_details({**event1, "description": "Notes\n\nCreated by script"}, config)
+    assert event_data.data["description"] == "Notes\n\nCreated by script"
+
+
+def test_config_snapshot(monkeypatch):
+    config = Config()
+    monkeypatch.setattr(config, "prefix", "[TEST]")
+    snapshot = config.snapshot()
+    assert snapshot.calendar_id == config.calendar_id
+    assert snapshot.target_calendar_id == config.target_calendar_id
+    event_data = EventData()
+    event_data.get_event_details(event1, snapshot)
+    assert event_data.data["summary"] == "[TEST] CS50P"
 
 
 def test_pop_unnecessary_keys():
@@ -98,7 +137,7 @@ def test_pop_unnecessary_keys():
         "sequence",
     ]
     event_data = EventData()
-    event_data.data = event1
+    event_data.data = event1.copy()
     event_data.pop_unnecessary_keys()
     assert all(key not in event_data.data for key in keys)
 
@@ -114,6 +153,77 @@ def test_check_calendars_in_attendees(monkeypatch, event, expected):
     assert event_data.check_calendars_in_attendees(event, config) == expected
 
 
+@pytest.mark.parametrize(
+    "event, expected",
+    [(event1, (None, None)), (event2, ("Both", "accepted")), (event3, ("Main", "accepted"))],
+)
+def test_classify_attendees(monkeypatch, event, expected):
+    config = Config()
+    monkeypatch.setattr(config, "calendar_id", "wolk.tomasz@gmail.com")
+    monkeypatch.setattr(config, "target_calendar_id", "test@gmail.com")
+    assert EventData.classify_attendees(event, config) == expected
+
+
+def test_get_attendee_response_status():
+    event = {**event2, "attendees": list(event2["attendees"])}
+    assert EventData.get_attendee_response_status(event, "wolk.tomasz@gmail.com") == "accepted"
+    assert EventData.get_attendee_response_status(event, "test@gmail.com") == "needsAction"
+    assert EventData.get_attendee_response_status(event, "jerry@gmail.com") is None
+    assert event == {**event2, "attendees": event2["attendees"]}
+    event["attendees"][0] = {"email": "test@gmail.com", "responseStatus": "declined"}
+    assert EventData.get_attendee_response_status(event, "test@gmail.com") == "declined"
+    event["attendees"] = event3["attendees"]
+    assert EventData.get_attendee_response_status(event, "jerry@gmail.com") == "needsAction"
+    assert EventData.get_attendee_response_status(event1, "wolk.tomasz@gmail.com") is None
+    assert EventData.get_attendee_response_status({"attendees": None}, "test@gmail.com") is None
+
+
+event4 = {
+    "kind": "calendar#event",
+    "id": "cgaqqy97yldnafvargfd1isd",
+    "eventType": "default",
+    "attendees": [
+        {"email": "jerry@gmail.com", "responseStatus": "needsAction"},
+        {"email": "wolk.tomasz@gmail.com", "responseStatus": "declined"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "event, expected",
+    [
+        (event1, (True, False, None)),
+        (event2, (False, False, None)),
+        (event4, (True, False, "declined")),
+        (
+            {**event4, "attendees": event2["attendees"]},
+            (True, True, "accepted"),
+        ),
+    ],
+)
+def test_classify_event(monkeypatch, event, expected):
+    config = Config()
+    monkeypatch.setattr(config, "calendar_id", "wolk.tomasz@gmail.com")
+    monkeypatch.setattr(config, "target_calendar_id", "test@gmail.com")
+    assert classify_event(event, config) == expected
+
+
+def test_service_pool(monkeypatch):
+    builds = []
+    monkeypatch.setattr(project, "build", lambda *args, **kwargs: builds.append(1) or object())
+    monkeypatch.setattr(project, "SERVICE_POOL", project.queue.SimpleQueue())
+    services = project.get_services()
+    # Services in use are never given to another webhook.
+    other_services = project.get_services()
+    assert other_services[0] is not services[0]
+    assert len(builds) == 4
+    project.release_services(services)
+    project.release_services(other_services)
+    assert project.get_services() is services
+    assert project.get_services() is other_services
+    assert len(builds) == 4
+
+
 @pytest.mark.parametrize(
     "target_event, status, response_status, expected",
     [
@@ -125,3 +235,299 @@ def test_check_calendars_in_attendees(monkeypatch, event, expected):
 )
 def test_check_what_to_do_with_event(target_event, status, response_status, expected):
     assert check_what_to_do_with_event(target_event, status, response_status) == expected
+
+
+def test_cached_formatter():
+    cached_formatter = CachedFormatter(DATE_FORMAT)
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+    for created in (1748520000.125, 1748520000.999, 1748520001.5):
+        record = logging.makeLogRecord(
+            {
+                "msg": "Event ID: %s",
+                "args": ("123",),
+                "levelname": "INFO",
+                "created": created,
+                "msecs": (created - int(created)) * 1000,
+            }
+        )
+        assert cached_formatter.format(record) == formatter.format(record)
+
+
+def test_fast_rotating_file_handler(tmp_path):
+    handler = FastRotatingFileHandler(
+        tmp_path / "test.log", maxBytes=100, backupCount=1, encoding="utf-8"
+    )
+    record = logging.makeLogRecord({"msg": "x" * 40, "levelname": "INFO"})
+    assert not handler.shouldRollover(record)
+    handler.emit(record)
+    assert not handler.shouldRollover(record)
+    handler.emit(record)
+    assert handler.shouldRollover(record)
+    handler.emit(record)
+    handler.close()
+    assert (tmp_path / "test.log.1").exists()
+
+
+@pytest.mark.parametrize(
+    "email, expected",
+    [
+        ("wolk.tomasz@gmail.com", True),
+        ("73c4p8b3qd0g62jnof68@group.calendar.google.com", True),
+        ("primary", False),
+        ("test@gmail", False),
+    ],
+)
+def test_email_re(email, expected):
+    assert bool(EMAIL_RE.match(email)) == expected
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.googleapis.com/auth/calendar.events", True),
+        ("https://username.pythonanywhere.com/notifications", True),
+        ("ftp://example.com", False),
+        ("https://localhost", False),
+        ("not a url", False),
+    ],
+)
+def test_url_re(url, expected):
+    assert bool(URL_RE.match(url)) == expected
+
+
+def test_logger_error_exc_info():
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    Logger.logger.addHandler(handler)
+    try:
+        error = ValueError("Not Found")
+        Logger.error("Error deleting event %s: %s.", "e1", error, exc_info=error)
+        Logger.error("CREDENTIALS is None.", exc_info=False)
+    finally:
+        Logger.logger.removeHandler(handler)
+    text = logging.Formatter().format(records[0])
+    assert "ValueError: Not Found" in text
+    assert "NoneType: None" not in text
+    assert not records[1].exc_info
+
+
+def http_error(status, content=b""):
+    response = type("Response", (dict,), {"status": status, "reason": ""})()
+    return HttpError(response, content)
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.requests))
+        if self.service.error is not None:
+            raise self.service.error
+        for request_id, (verb, kwargs) in self.requests:
+            status = self.service.statuses.get(kwargs["eventId"])
+            if status is not None:
+                self.callback(request_id, None, http_error(status))
+            elif self.service.rate_limited.pop(kwargs["eventId"], False):
+                self.callback(request_id, None, http_error(429))
+            else:
+                self.callback(request_id, {"id": kwargs["eventId"]}, None)
+
+
+class FakeRequest(tuple):
+    def __new__(cls, service, kwargs):
+        request = super().__new__(cls, ("get", kwargs))
+        request.service = service
+        return request
+
+    def execute(self):
+        self.service.single_gets.append(self[1]["eventId"])
+        return {"id": self[1]["eventId"], "single": True}
+
+
+class FakeService:
+    def __init__(self, rate_limited, error=None, statuses=None):
+        self.batch_sizes = []
+        self.rate_limited = dict.fromkeys(rate_limited, True)
+        self.error = error
+        self.statuses = statuses or {}
+        self.single_gets = []
+
+    def events(self):
+        return self
+
+    def delete(self, **kwargs):
+        return ("delete", kwargs)
+
+    def get(self, **kwargs):
+        return FakeRequest(self, kwargs)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+def test_flush(monkeypatch):
+    monkeypatch.setattr(project_event_data, "RETRY_BACKOFF_BASE", 0)
+    monkeypatch.setattr(project_event_data, "RETRY_BACKOFF_JITTER", 0)
+    service = FakeService(rate_limited=["7"])
+    for event_id in range(49):
+        EventData.delete_event("test@gmail.com", str(event_id), service)
+    assert service.batch_sizes == []
+    # 50th operation fills the batch - it's sent without waiting for flush().
+    for event_id in range(49, 60):
+        EventData.delete_event("test@gmail.com", str(event_id), service)
+    assert service.batch_sizes == [50, 1]
+    EventData.flush(service)
+    assert service.batch_sizes == [50, 1, 10]
+    assert len(project_event_data.current_batch_queue()) == 0
+
+
+def test_batch_queue_per_thread():
+    project_event_data.reset_batch_queue()
+    project_event_data.current_batch_queue().add(
+        "delete", {"calendarId": "test@gmail.com", "eventId": "1"}, lambda *args: None
+    )
+    other_thread = []
+    thread = threading.Thread(
+        target=lambda: other_thread.append(len(project_event_data.current_batch_queue()))
+    )
+    thread.start()
+    thread.join()
+    assert other_thread == [0]
+    assert len(project_event_data.current_batch_queue()) == 1
+    assert len(project_event_data.reset_batch_queue()) == 0
+
+
+def test_get_events_from_target_calendar():
+    # 404 - event doesn't exist, 500 - event is checked again with single request.
+    service = FakeService(rate_limited=[], statuses={"1": 404, "2": 500})
+    event_ids = [str(event_id) for event_id in range(60)] + ["0", "1"]
+    target_events = EventData.get_events_from_target_calendar(event_ids, service, Config())
+    assert service.batch_sizes == [50, 10]
+    assert list(target_events) == event_ids[:60]
+    assert target_events["0"] == {"id": "0"}
+    assert target_events["1"] is None
+    assert target_events["2"] == {"id": "2", "single": True}
+    assert service.single_gets == ["2"]
+
+
+def test_get_events_from_target_calendar_batch_error():
+    service = FakeService(rate_limited=[], error=http_error(400))
+    target_events = EventData.get_events_from_target_calendar(["a", "b"], service, Config())
+    assert target_events == {"a": {"id": "a", "single": True}, "b": {"id": "b", "single": True}}
+    assert service.single_gets == ["a", "b"]
+
+
+def test_execute_batch_error():
+    results = []
+
+    def callback(response, exception):
+        results.append(exception)
+
+    operations = [
+        ("delete", {"calendarId": "test@gmail.com", "eventId": str(event_id)}, callback)
+        for event_id in range(3)
+    ]
+    error = TimeoutError("timed out")
+    service = FakeService(rate_limited=[], error=error)
+    assert project_event_data.execute_batch(service, operations) == []
+    assert results == [error, error, error]
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (http_error(429), True),
+        (http_error(503), True),
+        (http_error(403, b'{"reason": "userRateLimitExceeded"}'), True),
+        (http_error(403, b'{"reason": "forbidden"}'), False),
+        (http_error(404), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable(error, expected):
+    assert project_event_data.is_retryable(error) == expected
+
+
+def test_retry_http(monkeypatch):
+    monkeypatch.setattr(project_event_data, "RETRY_BACKOFF_BASE", 0)
+    monkeypatch.setattr(project_event_data, "RETRY_BACKOFF_JITTER", 0)
+    errors = [http_error(500), http_error(429)]
+
+    @project_event_data.retry_http
+    def request():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert request() == "ok"
+
+    @project_event_data.retry_http
+    def not_found():
+        errors.append(1)
+        raise http_error(404)
+
+    with pytest.raises(HttpError):
+        not_found()
+    assert len(errors) == 1
+
+
+def test_retry_budget(monkeypatch):
+    monkeypatch.setattr(project_event_data, "RETRY_BACKOFF_BASE", 1)
+    monkeypatch.setattr(project_event_data, "RETRY_BACKOFF_JITTER", 0)
+    sleeps = []
+    monkeypatch.setattr(project_event_data.time, "sleep", sleeps.append)
+    calls = []
+
+    @project_event_data.retry_http
+    def request():
+        calls.append(1)
+        raise http_error(503)
+
+    # Waits 1 s and 2 s, next wait (4 s) doesn't fit in the budget.
+    project_event_data.reset_retry_budget(3.5)
+    with pytest.raises(HttpError):
+        request()
+    assert sleeps == [1, 2]
+    assert len(calls) == 3
+    # Budget is shared - flush() doesn't retry rate limited operations anymore.
+    service = FakeService(rate_limited=["1"])
+    results = []
+    project_event_data.current_batch_queue().add(
+        "delete",
+        {"calendarId": "test@gmail.com", "eventId": "1"},
+        lambda response, exception: results.append(exception),
+    )
+    EventData.flush(service)
+    assert service.batch_sizes == [1]
+    assert isinstance(results[0], HttpError)
+    project_event_data.reset_retry_budget()
+
+
+@pytest.mark.parametrize(
+    "seconds_ago, method, resource_state, expected",
+    [
+        (0, "POST", "exists", "208"),
+        (5, "GET", "exists", "405"),
+        (5, "POST", "sync", "200"),
+        (5, "POST", "exists", "exists"),
+        (5, "POST", None, "400"),
+        (5, "POST", "not_exists", "202"),
+    ],
+)
+def test_validate_post_request(seconds_ago, method, resource_state, expected):
+    time_now = datetime(2025, 5, 29, 12, 0, 0)
+    headers = {"X-Goog-Resource-State": resource_state} if resource_state else {}
+    with Flask(__name__).test_request_context(method=method, headers=headers):
+        assert (
+            NotificationChannel.validate_post_request(
+                time_now, time_now - timedelta(seconds=seconds_ago)
+            )
+            == expected
+        )